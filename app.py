@@ -9,12 +9,24 @@ Usage:
   2) Run:  python apply_rerun_patch.py
   3) Commit and redeploy.
 """
+import mmap
 import re
 from pathlib import Path
 from datetime import datetime
 
 EXCLUDE_DIRS = {".git", ".venv", "venv", "__pycache__"}
 PATTERN = re.compile(r"\bst\.experimental_rerun\s*\(")
+# Same pattern on raw bytes (it is pure ASCII) so files can be screened
+# through mmap without decoding them first.
+BPATTERN = re.compile(PATTERN.pattern.encode("ascii"))
+
+def needs_patch(py: Path) -> bool:
+    """Cheap pre-check: True if the raw file bytes contain the pattern."""
+    with open(py, "rb") as f:
+        if f.seek(0, 2) == 0:
+            return False
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return BPATTERN.search(mm) is not None
 
 def main(root: Path):
     changed = []
@@ -22,6 +34,8 @@ def main(root: Path):
         if any(part in EXCLUDE_DIRS for part in py.parts):
             continue
         try:
+            if not needs_patch(py):
+                continue
             src = py.read_text(encoding="utf-8")
         except Exception as e:
             print(f"[skip] {py}: {e}")